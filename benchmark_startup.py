@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Measure how long main.py takes to start up.
+
+Each case runs in a fresh Python interpreter, since import time is only
+paid once per process. Run this from the root of the repo (/app inside the
+Docker container):
+
+    ./benchmark_startup.py
+    ./benchmark_startup.py --runs 20
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+# Each case is (description, command line arguments to the Python interpreter)
+IMPORT_CASES = [
+    ('import argparse_helpers',
+        ['-c', 'import color_by_numbers.argparse_helpers']),
+    ('import subcommands',
+        ['-c', 'import color_by_numbers.subcommands']),
+    ('import downscale (cv2, numpy, jinja2)',
+        ['-c', 'import color_by_numbers.downscale']),
+    ('import shapes (cv2, numpy, jinja2)',
+        ['-c', 'import color_by_numbers.shapes']),
+]
+
+STARTUP_CASES = [
+    ('main.py --help',
+        ['main.py', '--help']),
+    ('main.py downscale --help',
+        ['main.py', 'downscale', '--help']),
+    ('main.py downscale <bad input dir>',
+        ['main.py', 'downscale', 'gears.jpg', 'output/gears.ps']),
+    ('main.py downscale <missing input>',
+        ['main.py', 'downscale', 'input/missing.jpg', 'output/missing.ps']),
+    ('main.py shapes <bad output ext>',
+        ['main.py', 'shapes', 'input/gears.jpg', 'output/gears.pdf']),
+]
+
+def time_command(python_args, runs):
+    """
+    Run the Python interpreter with the given arguments several times.
+    Return a list of wall-clock times in milliseconds and the exit code
+    of the last run.
+    """
+    command = [sys.executable] + python_args
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append((time.perf_counter() - start) * 1000.0)
+    return times, result.returncode
+
+def report(title, cases, runs, expect_success=True):
+    """
+    Time each case and print a table of the results. If expect_success is
+    True, cases that exit with an error are marked as failed since their
+    timing is meaningless (e.g. cv2 is not installed)
+    """
+    print(title)
+    print('-' * 80)
+    for description, python_args in cases:
+        times, returncode = time_command(python_args, runs)
+        median = statistics.median(times)
+        best = min(times)
+        status = 'FAILED' if expect_success and returncode != 0 else ''
+        print(
+            f'{description:<45} {median:8.1f} ms {best:8.1f} ms (min) '
+            f'{status}')
+    print()
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark import time and startup time of main.py')
+    parser.add_argument(
+        '-r',
+        '--runs',
+        type=int,
+        default=10,
+        help='How many times to run each case')
+    args = parser.parse_args()
+
+    report('Baseline', [('python -c pass', ['-c', 'pass'])], args.runs)
+    report('Import time', IMPORT_CASES, args.runs)
+    # --help exits with 0, but rejected arguments exit with 2
+    report('Startup time', STARTUP_CASES, args.runs, expect_success=False)
+
+if __name__ == '__main__':
+    main()
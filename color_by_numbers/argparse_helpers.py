@@ -1,25 +1,22 @@
 """
 This file contains Argparse type functions for use in subcommands.
 """
-import cv2
+import os
 import argparse
 
 def input_image(fname):
     """
-    Validate that a filename matches 'input/*'. Open it as
-    an image.
+    Validate that a filename matches 'input/*' and that the file exists.
+    The image is not decoded here, this will be handled by the command.
     """
     if not fname.startswith('input/'):
         raise argparse.ArgumentTypeError('input file must be in input/')
 
-    # Read an image from the input directory
-    img = cv2.imread(fname)
-
-    # make sure we got an image
-    if img is None:
+    # make sure the file exists
+    if not os.path.isfile(fname):
         raise argparse.ArgumentTypeError('{} not found'.format(fname))
 
-    return img
+    return fname
 
 def output_postscript(fname):
     """
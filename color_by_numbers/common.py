@@ -1,5 +1,21 @@
+import sys
+
 import cv2
 
+def read_image(fname):
+    """
+    Decode the input image. The filename was already validated by
+    argparse_helpers.input_image(), but the file might still not be
+    an image OpenCV can read.
+    """
+    img = cv2.imread(fname)
+
+    # make sure we got an image
+    if img is None:
+        sys.exit('error: {} could not be read as an image'.format(fname))
+
+    return img
+
 def debug_save(fname, image, args):
     """
     if --debug is specified, save an extra image in output/debug
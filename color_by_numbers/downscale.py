@@ -6,8 +6,7 @@ import cv2
 import numpy
 from jinja2 import Environment, PackageLoader
 
-from color_by_numbers.common import debug_save
-from color_by_numbers.argparse_helpers import to_points
+from color_by_numbers.common import debug_save, read_image
 from color_by_numbers.page_size import DimensionsCalculator
 
 def downsample(image, block_size):
@@ -69,30 +68,18 @@ def format_postscript(image, args, page_size):
         page_width=w,
         page_height=h)
 
-def configure_parser(subparsers, common):
-    """
-    Configure parser for the downscale subcommand
-    """
-    parser_ds = subparsers.add_parser('downscale', parents=[common])
-    parser_ds.add_argument(
-        '-s',
-        '--square-size',
-        type=to_points,
-        default=to_points('0.25 in'),
-        help="Size of each square in the grid")
-    parser_ds.set_defaults(func=main)
-
 def main(args):
     """Entry point for the downscale script"""
 
     print("Generating a color-by-numbers page with the Downscale algorithm!")
-    print(f'Image size (rows, cols): {args.input.shape}')
+    image = read_image(args.input)
+    print(f'Image size (rows, cols): {image.shape}')
     print(f'Paper size (pt.): {args.paper_size}')
     print(f'Margins (pt.): {args.margin}')
 
     # Make the input image grayscale
     print("Converting to grayscale...")
-    img = cv2.cvtColor(args.input, cv2.COLOR_BGR2GRAY)
+    img = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
     debug_save('gray.png', img, args)
 
     # This calculator handles differences in portrait/landscape orientation.
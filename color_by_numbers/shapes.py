@@ -12,8 +12,8 @@ import cv2
 import numpy
 from jinja2 import Environment, PackageLoader
 
+from color_by_numbers.common import read_image
 from color_by_numbers.page_size import DimensionsCalculator
-from color_by_numbers.argparse_helpers import to_points
 
 def choose_diameters(img, args):
     """
@@ -201,35 +201,13 @@ def write_postcript(image_commands, args, page_size):
     with open(args.output, 'w') as f:
         f.write(code + '\n')
 
-def configure_parser(subparsers, common):
-    """
-    Configure parser for the downscale subcommand
-    """
-    # Downscale arguments
-    parser_shapes = subparsers.add_parser('shapes', parents=[common])
-    parser_shapes.add_argument(
-        '-i',
-        '--iterations',
-        type=int,
-        default=6,
-        help=(
-            'Maximum number of iterations of covering the image with circles. '
-            'Note that this is O(n^2) in the number of iterations'))
-    parser_shapes.add_argument(
-        '-l',
-        '--line-width',
-        type=to_points,
-        default=0.3,
-        help='Line width for all shapes in points')
-    parser_shapes.set_defaults(func=main)
-
 def main(args):
     """
     Entry point for the shapes method
     """
     # Convert input image to grayscale and flip upside down
     # since PostScript uses a y-up coordinate system
-    img = cv2.cvtColor(args.input, cv2.COLOR_BGR2GRAY)
+    img = cv2.cvtColor(read_image(args.input), cv2.COLOR_BGR2GRAY)
     img = numpy.flipud(img)
 
     # This calculator will be used to handle scaling things to
@@ -0,0 +1,56 @@
+"""
+This file configures the subparser for each algorithm.
+
+The algorithm modules import OpenCV, NumPy and Jinja2, which are slow to
+load. They are only imported once a subcommand actually runs, so that
+--help and invalid arguments return quickly.
+"""
+from color_by_numbers.argparse_helpers import to_points
+
+def run_downscale(args):
+    """
+    Import and run the downscale algorithm
+    """
+    from color_by_numbers import downscale
+    downscale.main(args)
+
+def run_shapes(args):
+    """
+    Import and run the shapes algorithm
+    """
+    from color_by_numbers import shapes
+    shapes.main(args)
+
+def configure_downscale(subparsers, common):
+    """
+    Configure parser for the downscale subcommand
+    """
+    parser_ds = subparsers.add_parser('downscale', parents=[common])
+    parser_ds.add_argument(
+        '-s',
+        '--square-size',
+        type=to_points,
+        default=to_points('0.25 in'),
+        help="Size of each square in the grid")
+    parser_ds.set_defaults(func=run_downscale)
+
+def configure_shapes(subparsers, common):
+    """
+    Configure parser for the shapes subcommand
+    """
+    parser_shapes = subparsers.add_parser('shapes', parents=[common])
+    parser_shapes.add_argument(
+        '-i',
+        '--iterations',
+        type=int,
+        default=6,
+        help=(
+            'Maximum number of iterations of covering the image with circles. '
+            'Note that this is O(n^2) in the number of iterations'))
+    parser_shapes.add_argument(
+        '-l',
+        '--line-width',
+        type=to_points,
+        default=0.3,
+        help='Line width for all shapes in points')
+    parser_shapes.set_defaults(func=run_shapes)
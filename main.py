@@ -1,10 +1,10 @@
 #!/usr/bin/env python
 import argparse
 
-from color_by_numbers import downscale, shapes
 from color_by_numbers.argparse_helpers import (
     input_image, output_postscript, paper_dimensions, to_points
 )
+from color_by_numbers.subcommands import configure_downscale, configure_shapes
 
 def parse_args():
     """
@@ -51,8 +51,8 @@ def parse_args():
     # Each subcommand will configure its own subparser
     subparsers = parser.add_subparsers(dest='sub_command')
     subparsers.required = True
-    downscale.configure_parser(subparsers, common)
-    shapes.configure_parser(subparsers, common)
+    configure_downscale(subparsers, common)
+    configure_shapes(subparsers, common)
 
     return parser.parse_args()
 